@@ -3,7 +3,8 @@
 Jira Ticket Scraper
 
 Fetches tickets from Jira using Playwright and the Jira REST API.
-Saves each ticket description to a separate text file in the output directory.
+Saves each ticket description to a separate text file in the output directory,
+or all tickets to a single JSONL or Markdown file.
 
 Also supports changing ticket status via the Jira transitions API.
 
@@ -15,25 +16,43 @@ Examples:
     ./scrape-jira.sh                        # Fetch all tickets assigned to you
     ./scrape-jira.sh --status "In Progress" # Fetch only in-progress tickets
     ./scrape-jira.sh --status "Open"        # Fetch only open tickets
+    ./scrape-jira.sh --since 7d             # Fetch tickets updated in the last week
     ./scrape-jira.sh --login --headed       # Force new login with visible browser
     ./scrape-jira.sh --change-status TICKET-123 --to-status "In Progress"
 """
 import asyncio
 import argparse
+import difflib
+import hashlib
 import json
 import os
 import re
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from playwright.async_api import async_playwright
+from urllib.parse import quote, urlencode
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 # =============================================================================
 # Configuration - paths relative to script location for portability
 # =============================================================================
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
-COOKIES_FILE = SCRIPT_DIR / ".jira_cookies.json"
+SESSION_FILE = SCRIPT_DIR / ".jira_session.json"  # Playwright storage_state
 CREDENTIALS_FILE = SCRIPT_DIR / ".jira_credentials.json"
+PROFILE_DIR = SCRIPT_DIR / ".pw-profile"  # Persistent Chromium profile
+CACHE_DIR = SCRIPT_DIR / ".cache"  # Recent search responses
 OUTPUT_DIR = SCRIPT_DIR / "output"
+MANIFEST_FILE = OUTPUT_DIR / ".manifest.json"  # Last saved "updated" per ticket
+
+# How fetched tickets are written: one .txt per ticket in status folders,
+# or all tickets in a single file
+OUTPUT_FORMATS = ("per-file", "jsonl", "single-md")
+COMBINED_OUTPUT_FILES = {
+    "jsonl": OUTPUT_DIR / "tickets.jsonl",
+    "single-md": OUTPUT_DIR / "tickets.md",
+}
 
 # Jira configuration - can be overridden via environment variables
 JIRA_BASE_URL = os.environ.get("JIRA_BASE_URL", "https://jira.example.com")
@@ -49,39 +68,164 @@ VALID_STATUSES = [
     "Done",
     "Closed",
 ]
+VALID_STATUSES_SET = frozenset(VALID_STATUSES)
+# Common statuses keyed by their lowercased, whitespace-collapsed name
+STATUSES_BY_NORMALIZED_NAME = {" ".join(s.lower().split()): s for s in VALID_STATUSES}
+EPILOG_STATUSES = ", ".join(VALID_STATUSES)
+
+# Issue fields read by format_ticket; everything else is left out of
+# search responses (the issue key is always returned)
+NEEDED_FIELDS = (
+    "summary",
+    "status",
+    "priority",
+    "assignee",
+    "reporter",
+    "labels",
+    "created",
+    "updated",
+    "description",
+)
+
+# Upper bound on concurrent Jira REST requests (pagination, transitions)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Timeout for Jira REST requests, in milliseconds
+API_TIMEOUT_MS = 30000
+
+# How long a cached search response is reused before querying Jira again
+CACHE_TTL_SECONDS = 60
+
+# Upper bound on ticket files written concurrently
+MAX_CONCURRENT_SAVES = 12
+
+# Chromium flags that trim background work we never need for API scraping
+BROWSER_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+]
+
+# Jira subresources skipped in headless mode (only page.url is inspected)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Precompiled patterns for sanitize_folder_name
+_NON_WORD_RE = re.compile(r'[^\w\-]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+# Values accepted by --since: a period back from now ("24h", "7d", "2w",
+# optionally with JQL's leading minus) or a date ("2024-01-31")
+_SINCE_PERIOD_RE = re.compile(r'-?(\d+[mhdw])')
+_SINCE_DATE_RE = re.compile(r'\d{4}[-/]\d{2}[-/]\d{2}')
 
 # =============================================================================
-# Cookie and credential management
+# Session and credential management
 # =============================================================================
 
 
-async def load_cookies():
-    """Load saved session cookies from file."""
-    if COOKIES_FILE.exists():
-        with open(COOKIES_FILE, "r") as f:
-            return json.load(f)
-    return []
+def _read_json(path):
+    """Read and parse a JSON file (blocking; run via asyncio.to_thread)."""
+    return json.loads(path.read_bytes())
+
+
+def _write_file_atomic(path, chunks):
+    """Write byte chunks to a file via a temp file and rename (blocking)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.writelines(chunks)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
-async def save_cookies(cookies):
-    """Save session cookies to file for reuse."""
-    with open(COOKIES_FILE, "w") as f:
-        json.dump(cookies, f, indent=2)
+def _write_json_atomic(path, data):
+    """Write a JSON file via a temp file and rename (blocking)."""
+    _write_file_atomic(path, (json.dumps(data, separators=(",", ":")).encode("utf-8"),))
+
+
+async def load_session():
+    """Load the saved Playwright storage_state, or None if unavailable."""
+    if SESSION_FILE.exists():
+        try:
+            return await asyncio.to_thread(_read_json, SESSION_FILE)
+        except json.JSONDecodeError:
+            pass
+    return None
+
+
+async def save_session(state):
+    """Save Playwright storage_state (cookies and web storage) for reuse."""
+    await asyncio.to_thread(_write_json_atomic, SESSION_FILE, state)
 
 
 async def load_credentials():
     """Load user credentials from file."""
     if CREDENTIALS_FILE.exists():
-        with open(CREDENTIALS_FILE, "r") as f:
-            return json.load(f)
+        return await asyncio.to_thread(_read_json, CREDENTIALS_FILE)
     return None
 
+# =============================================================================
+# Search response cache
+# =============================================================================
+
+
+def _cache_path(jql_query):
+    """Cache file for a query, keyed by Jira instance and JQL."""
+    key = hashlib.sha1(f"{JIRA_BASE_URL}\n{jql_query}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _read_fresh_json(path, max_age):
+    """Read a JSON file if it is younger than max_age seconds (blocking)."""
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        return json.loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+async def load_cached_search(jql_query):
+    """Return a cached search response for the query, or None if stale/missing."""
+    return await asyncio.to_thread(_read_fresh_json, _cache_path(jql_query), CACHE_TTL_SECONDS)
+
+
+async def save_cached_search(jql_query, data):
+    """Cache a search response so repeat runs can skip Jira entirely."""
+    await asyncio.to_thread(_write_json_atomic, _cache_path(jql_query), data)
+
+
+async def iter_cached_pages(data):
+    """Yield a cached search response in the same shape as iter_search_pages."""
+    yield data["issues"]
+
+
+def _remove_cached_searches():
+    """Delete all cached search response files (blocking)."""
+    for path in CACHE_DIR.glob("*.json"):
+        path.unlink(missing_ok=True)
+
+
+async def clear_search_cache():
+    """Drop all cached search responses (e.g. after a status change)."""
+    await asyncio.to_thread(_remove_cached_searches)
+
 # =============================================================================
 # Authentication
 # =============================================================================
 
 
-async def login(page, headed=False):
+def is_login_url(url):
+    """Return True if the URL belongs to the Jira login page or Microsoft SSO."""
+    return "login" in url.lower() or "microsoftonline" in url
+
+
+async def login(page, credentials=None, headed=False):
     """
     Handle Microsoft SSO login flow.
     
@@ -90,11 +234,20 @@ async def login(page, headed=False):
     
     Args:
         page: Playwright page object
+        credentials: Dict with username/password (headless mode only)
         headed: If True, wait for manual login completion
     """
     print("Logging in to Jira...")
     await page.goto(f"{JIRA_BASE_URL}/login.jsp")
-    await page.wait_for_timeout(2000)
+    
+    # Wait for the SSO redirect (or an immediate bounce back to Jira)
+    try:
+        await page.wait_for_url(
+            lambda url: "microsoftonline" in url or not is_login_url(url),
+            timeout=10000,
+        )
+    except PlaywrightTimeoutError:
+        pass
     
     if headed:
         # In headed mode, wait for user to complete login manually
@@ -104,15 +257,13 @@ async def login(page, headed=False):
         print("=" * 60 + "\n")
         
         # Wait until we're back on Jira (not login or microsoftonline)
-        while "login" in page.url.lower() or "microsoftonline" in page.url:
-            await page.wait_for_timeout(1000)
+        await page.wait_for_url(lambda url: not is_login_url(url), timeout=0)
+        await page.wait_for_load_state("domcontentloaded")
         
         print("Login successful!")
-        await page.wait_for_timeout(2000)
         return True
     
     # Headless mode: attempt automatic login
-    credentials = await load_credentials()
     if not credentials:
         print("No credentials found. Please create .jira_credentials.json")
         print("Or use --headed flag for interactive login.")
@@ -123,26 +274,148 @@ async def login(page, headed=False):
         # Enter email
         await page.fill('input[type="email"]', credentials["username"])
         await page.click('input[type="submit"]')
-        await page.wait_for_timeout(2000)
         
-        # Enter password (may fail if already authenticated via SSO)
+        # Enter password (field never appears if already authenticated via SSO)
         try:
+            await page.wait_for_selector('input[type="password"]', timeout=10000)
             await page.fill('input[type="password"]', credentials["password"])
             await page.click('input[type="submit"]')
-        except:
+        except PlaywrightTimeoutError:
             pass
         
         # Wait for redirect back to Jira
-        await page.wait_for_timeout(5000)
+        try:
+            await page.wait_for_url(lambda url: "microsoftonline" not in url, timeout=15000)
+        except PlaywrightTimeoutError:
+            print("Timed out waiting for redirect back to Jira")
     
     return True
 
+
+async def _block_static_assets(route):
+    """Route handler that aborts Jira images, fonts, media and CSS."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def establish_session(playwright, headed=False, force_login=False):
+    """
+    Log in through Chromium and export the session to SESSION_FILE.
+    
+    The browser is only needed for the SSO flow; it is closed before
+    returning so all API work can run over a plain APIRequestContext.
+    
+    Args:
+        playwright: Running Playwright instance
+        headed: If True, show the browser for interactive login
+        force_login: If True, discard the stored session first
+    
+    Returns:
+        The exported storage_state dict, or None if login failed
+    """
+    # Launch browser with a persistent profile so cookies and web storage
+    # survive between runs (headed if --headed is set)
+    context = await playwright.chromium.launch_persistent_context(
+        str(PROFILE_DIR), headless=not headed, args=BROWSER_ARGS
+    )
+    
+    # Nobody sees the headless dashboard, so skip its images, CSS and fonts;
+    # the Microsoft login pages are left alone so their form renders normally.
+    # Routing disables the HTTP cache, so the profile's disk cache only
+    # helps headed runs; headless runs skip those assets entirely instead.
+    if not headed:
+        await context.route(f"{JIRA_BASE_URL}/**", _block_static_assets)
+    
+    # Drop the stored session if a fresh login was requested
+    if force_login:
+        await context.clear_cookies()
+    
+    # A persistent context opens with a blank tab already; reuse it
+    page = context.pages[0] if context.pages else await context.new_page()
+    await page.goto(JIRA_BASE_URL)
+    await page.wait_for_load_state("domcontentloaded")
+    
+    # Check if we need to login (redirected to login page)
+    if is_login_url(page.url):
+        print("Session expired or no session found. Logging in...")
+        credentials = None if headed else await load_credentials()
+        if not await login(page, credentials, headed=headed):
+            # Keep the previous session file rather than saving a logged-out one
+            await context.close()
+            return None
+        
+        # Wait until the session has landed back on Jira
+        try:
+            await page.wait_for_url(
+                lambda url: url.startswith(JIRA_BASE_URL) and not is_login_url(url),
+                timeout=15000,
+            )
+        except PlaywrightTimeoutError:
+            print("Still not back on Jira after login; continuing anyway")
+    
+    # Export session state for the browserless API context
+    state = await context.storage_state()
+    await context.close()
+    
+    await save_session(state)
+    return state
+
 # =============================================================================
 # Jira API interaction
 # =============================================================================
 
 
-async def get_transitions(page, issue_key):
+async def new_api_context(playwright, session):
+    """Create an APIRequestContext for Jira REST calls from a storage_state."""
+    return await playwright.request.new_context(storage_state=session, timeout=API_TIMEOUT_MS)
+
+
+def bounded_spawner(limit=MAX_CONCURRENT_REQUESTS):
+    """
+    Return a function that schedules coroutines as tasks, with at most
+    `limit` of them running at once.
+    
+    Tasks can be spawned incrementally (e.g. as search pages arrive) and
+    all share the same limit.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(coro):
+        try:
+            async with semaphore:
+                return await coro
+        finally:
+            # A task cancelled while waiting never started its coroutine
+            coro.close()
+    
+    def spawn(coro):
+        return asyncio.create_task(run(coro))
+    
+    return spawn
+
+
+async def gather_bounded(coros, limit=MAX_CONCURRENT_REQUESTS):
+    """Like asyncio.gather, but with at most `limit` coroutines running at once."""
+    spawn = bounded_spawner(limit)
+    return await asyncio.gather(*(spawn(coro) for coro in coros))
+
+
+async def has_valid_session(request):
+    """
+    Check whether a request context is still logged in to Jira.
+    
+    An expired session either gets a 401 or is redirected to the SSO
+    login page, which answers with HTML instead of JSON.
+    """
+    response = await request.get(
+        f"{JIRA_BASE_URL}/rest/api/2/myself", headers={"Accept": "application/json"}
+    )
+    return response.ok and "json" in response.headers.get("content-type", "")
+
+
+async def get_transitions(request, issue_key):
     """
     Fetch available transitions for a ticket.
     
@@ -150,7 +423,7 @@ async def get_transitions(page, issue_key):
     returns the list of available transitions for the given issue.
     
     Args:
-        page: Playwright page object with active session
+        request: Playwright APIRequestContext with active session
         issue_key: Jira issue key (e.g., "PROJECT-123")
     
     Returns:
@@ -159,31 +432,14 @@ async def get_transitions(page, issue_key):
     api_url = f"{JIRA_BASE_URL}/rest/api/2/issue/{issue_key}/transitions"
     
     print(f"Fetching available transitions for {issue_key}...")
-    response = await page.goto(api_url)
+    response = await request.get(api_url, headers={"Accept": "application/json"})
     
     if response.status != 200:
         print(f"Failed to fetch transitions: HTTP {response.status}")
         return None
     
-    # Extract JSON from page content
-    content = await page.content()
-    
-    # Try to find JSON in <pre> tags first (Chrome format)
-    json_match = re.search(r'<pre[^>]*>(.*?)</pre>', content, re.DOTALL)
-    if json_match:
-        json_text = json_match.group(1)
-        json_text = json_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"')
-    else:
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', content, re.DOTALL)
-        if body_match:
-            json_text = body_match.group(1).strip()
-            json_text = re.sub(r'<[^>]+>', '', json_text)
-            json_text = json_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"')
-        else:
-            json_text = content
-    
     try:
-        data = json.loads(json_text)
+        data = json.loads(await response.body())
         return data.get("transitions", [])
     except json.JSONDecodeError as e:
         print(f"Failed to parse transitions JSON: {e}")
@@ -210,15 +466,15 @@ def find_transition_by_status(transitions, target_status):
     return None
 
 
-async def execute_transition(page, issue_key, transition_id):
+async def execute_transition(request, issue_key, transition_id):
     """
     Execute a transition to change ticket status.
     
-    Uses page.evaluate() to make an authenticated POST request
-    using the browser's session cookies.
+    POSTs directly through the APIRequestContext, which carries the
+    session cookies, so no page navigation or in-browser fetch() is needed.
     
     Args:
-        page: Playwright page object with active session
+        request: Playwright APIRequestContext with active session
         issue_key: Jira issue key (e.g., "PROJECT-123")
         transition_id: ID of the transition to execute
     
@@ -229,52 +485,28 @@ async def execute_transition(page, issue_key, transition_id):
     
     print(f"Executing transition {transition_id} on {issue_key}...")
     
-    # Navigate to the issue page first so fetch() runs from correct origin
-    await page.goto(f"{JIRA_BASE_URL}/browse/{issue_key}")
-    await page.wait_for_timeout(1000)
-    
-    # Use page.evaluate to make POST request with browser cookies
-    result = await page.evaluate("""
-        async (args) => {
-            const [url, transitionId] = args;
-            try {
-                const response = await fetch(url, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        transition: { id: transitionId }
-                    }),
-                    credentials: 'include'
-                });
-                return {
-                    ok: response.ok,
-                    status: response.status,
-                    statusText: response.statusText
-                };
-            } catch (error) {
-                return { ok: false, error: error.message };
-            }
-        }
-    """, [api_url, transition_id])
-    
-    if result.get("ok"):
+    # A dict payload is serialized as JSON with the matching Content-Type
+    response = await request.post(
+        api_url,
+        data={"transition": {"id": transition_id}},
+        headers={"X-Atlassian-Token": "no-check"},
+    )
+    
+    if response.ok:
         return True
     else:
-        error_msg = result.get("error") or f"HTTP {result.get('status')} {result.get('statusText')}"
-        print(f"Failed to execute transition: {error_msg}")
+        print(f"Failed to execute transition on {issue_key}: HTTP {response.status} {response.status_text}")
         return False
 
 
-async def get_active_sprint(page):
+async def get_active_sprint(request):
     """
     Get the active sprint for the project board.
     
     Uses the Jira Agile REST API to fetch sprints and find the active one.
     
     Args:
-        page: Playwright page object with active session
+        request: Playwright APIRequestContext with active session
     
     Returns:
         Sprint object with id and name, or None if no active sprint found
@@ -282,30 +514,14 @@ async def get_active_sprint(page):
     api_url = f"{JIRA_BASE_URL}/rest/agile/1.0/board/{JIRA_BOARD_ID}/sprint?state=active"
     
     print("Fetching active sprint...")
-    response = await page.goto(api_url)
+    response = await request.get(api_url, headers={"Accept": "application/json"})
     
     if response.status != 200:
         print(f"Failed to fetch sprints: HTTP {response.status}")
         return None
     
-    content = await page.content()
-    
-    # Extract JSON from page content
-    json_match = re.search(r'<pre[^>]*>(.*?)</pre>', content, re.DOTALL)
-    if json_match:
-        json_text = json_match.group(1)
-        json_text = json_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"')
-    else:
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', content, re.DOTALL)
-        if body_match:
-            json_text = body_match.group(1).strip()
-            json_text = re.sub(r'<[^>]+>', '', json_text)
-            json_text = json_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"')
-        else:
-            json_text = content
-    
     try:
-        data = json.loads(json_text)
+        data = json.loads(await response.body())
         sprints = data.get("values", [])
         if sprints:
             active_sprint = sprints[0]
@@ -319,90 +535,63 @@ async def get_active_sprint(page):
         return None
 
 
-async def move_to_sprint(page, issue_key, sprint_id):
+async def move_to_sprint(request, issue_keys, sprint_id):
     """
-    Move a ticket to a specific sprint.
+    Move tickets to a specific sprint.
     
-    Uses the Jira Agile REST API to add the issue to the sprint.
+    Uses the Jira Agile REST API to add the issues to the sprint in a
+    single request.
     
     Args:
-        page: Playwright page object with active session
-        issue_key: Jira issue key (e.g., "PROJECT-123")
-        sprint_id: ID of the sprint to move the issue to
+        request: Playwright APIRequestContext with active session
+        issue_keys: List of Jira issue keys (e.g., ["PROJECT-123"])
+        sprint_id: ID of the sprint to move the issues to
     
     Returns:
         True on success, False on failure
     """
     api_url = f"{JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
     
-    print(f"Moving {issue_key} to sprint {sprint_id}...")
-    
-    # Navigate to Jira page first so fetch() runs from correct origin
-    await page.goto(f"{JIRA_BASE_URL}/browse/{issue_key}")
-    await page.wait_for_timeout(1000)
-    
-    # Use page.evaluate to make POST request with browser cookies
-    result = await page.evaluate("""
-        async (args) => {
-            const [url, issueKey] = args;
-            try {
-                const response = await fetch(url, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        issues: [issueKey]
-                    }),
-                    credentials: 'include'
-                });
-                return {
-                    ok: response.ok,
-                    status: response.status,
-                    statusText: response.statusText
-                };
-            } catch (error) {
-                return { ok: false, error: error.message };
-            }
-        }
-    """, [api_url, issue_key])
-    
-    if result.get("ok"):
-        print(f"Successfully moved {issue_key} to sprint")
+    keys = ", ".join(issue_keys)
+    print(f"Moving {keys} to sprint {sprint_id}...")
+    
+    # A dict payload is serialized as JSON with the matching Content-Type
+    response = await request.post(
+        api_url,
+        data={"issues": issue_keys},
+        headers={"X-Atlassian-Token": "no-check"},
+    )
+    
+    if response.ok:
+        print(f"Successfully moved {keys} to sprint")
         return True
     else:
-        error_msg = result.get("error") or f"HTTP {result.get('status')} {result.get('statusText')}"
-        print(f"Failed to move to sprint: {error_msg}")
+        print(f"Failed to move to sprint: HTTP {response.status} {response.status_text}")
         return False
 
 
-async def change_ticket_status(page, issue_key, target_status):
+def select_transition(issue_key, transitions, target_status):
     """
-    Change a ticket's status to the target status.
+    Pick the transition leading to the target status for one ticket.
     
-    This function orchestrates the full status change:
-    1. Fetch available transitions for the issue
-    2. Find the transition that leads to the target status
-    3. Execute the transition
+    Prints the available transitions and explains why none matched.
     
     Args:
-        page: Playwright page object with active session
         issue_key: Jira issue key (e.g., "PROJECT-123")
+        transitions: List of transitions from get_transitions(), or None
         target_status: Desired status name
     
     Returns:
-        True on success, False on failure
+        Transition object if found, None otherwise
     """
-    # Get available transitions
-    transitions = await get_transitions(page, issue_key)
     if transitions is None:
-        return False
+        return None
     
     if not transitions:
         print(f"No transitions available for {issue_key}")
         print("This may mean you don't have permission to change the status,")
         print("or the ticket is in a state where no transitions are allowed.")
-        return False
+        return None
     
     # Show available transitions
     print(f"\nAvailable transitions for {issue_key}:")
@@ -413,96 +602,212 @@ async def change_ticket_status(page, issue_key, target_status):
     # Find matching transition
     transition = find_transition_by_status(transitions, target_status)
     if not transition:
-        print(f"\nError: Cannot transition to '{target_status}'")
+        print(f"\nError: Cannot transition {issue_key} to '{target_status}'")
         print(f"Available target statuses: {', '.join(t.get('to', {}).get('name', '') for t in transitions)}")
-        return False
+        return None
     
     print(f"\nTransitioning {issue_key} to '{target_status}' via '{transition.get('name')}'...")
+    return transition
+
+
+async def change_ticket_status(request, issue_keys, target_status):
+    """
+    Change the status of one or more tickets to the target status.
     
-    # Execute the transition
-    success = await execute_transition(page, issue_key, transition.get("id"))
+    This function orchestrates the full status change:
+    1. Fetch available transitions for all issues in parallel
+    2. Find the transition that leads to the target status for each
+    3. Execute the transitions in parallel
     
-    if success:
-        print(f"Successfully changed {issue_key} status to '{target_status}'")
-        
-        # If transitioning to "In Progress", also move to active sprint
-        if target_status.lower() == "in progress":
-            active_sprint = await get_active_sprint(page)
-            if active_sprint:
-                await move_to_sprint(page, issue_key, active_sprint.get("id"))
+    Args:
+        request: Playwright APIRequestContext with active session
+        issue_keys: List of Jira issue keys (e.g., ["PROJECT-123"])
+        target_status: Desired status name
     
-    return success
+    Returns:
+        True if every ticket was changed, False otherwise
+    """
+    # Get available transitions
+    all_transitions = await gather_bounded(
+        get_transitions(request, key) for key in issue_keys
+    )
+    
+    # Find matching transitions
+    plans = []
+    for issue_key, transitions in zip(issue_keys, all_transitions):
+        transition = select_transition(issue_key, transitions, target_status)
+        if transition:
+            plans.append((issue_key, transition.get("id")))
+    
+    # Execute the transitions
+    results = await gather_bounded(
+        execute_transition(request, key, transition_id) for key, transition_id in plans
+    )
+    
+    changed = [key for (key, _), success in zip(plans, results) if success]
+    for key in changed:
+        print(f"Successfully changed {key} status to '{target_status}'")
+    
+    # If transitioning to "In Progress", also move to active sprint
+    if changed and target_status.lower() == "in progress":
+        active_sprint = await get_active_sprint(request)
+        if active_sprint:
+            await move_to_sprint(request, changed, active_sprint.get("id"))
+    
+    return len(changed) == len(issue_keys)
+
+
+def _normalize_status(status):
+    """Lowercase a status and collapse its whitespace for comparison."""
+    return " ".join(status.lower().split())
+
+
+def check_status(status):
+    """
+    Match a status value against the common status values.
+    
+    Jira compares statuses case-insensitively, so a value that only differs
+    from a common status in case or whitespace (e.g. "in  progress") is
+    replaced by its usual spelling. Statuses vary by project, so other
+    values are allowed through; a near miss of a common status (e.g.
+    "In Progres") is returned as a suggestion.
+    
+    Returns:
+        Tuple (status, suggestion): the status to use, and a similar
+        common status the value may be a typo of (or None)
+    """
+    if status in VALID_STATUSES_SET:
+        return status, None
+    
+    normalized = _normalize_status(status)
+    if normalized in STATUSES_BY_NORMALIZED_NAME:
+        return STATUSES_BY_NORMALIZED_NAME[normalized], None
+    
+    matches = difflib.get_close_matches(normalized, STATUSES_BY_NORMALIZED_NAME, n=1, cutoff=0.9)
+    return status, STATUSES_BY_NORMALIZED_NAME[matches[0]] if matches else None
 
 
-def build_jql_query(status=None):
+@lru_cache(maxsize=128)
+def build_jql_query(status=None, since=None):
     """
     Build JQL query based on provided filters.
     
     Args:
         status: Optional status filter (e.g., "In Progress", "Open")
+        since: Optional lower bound on the "updated" date, as a JQL
+            relative period (e.g., "-7d") or a date (e.g., "2024-01-31")
     
     Returns:
         JQL query string
     """
-    query_parts = ["assignee = currentUser()"]
-    
+    jql = "assignee = currentUser()"
     if status:
-        query_parts.append(f"status = '{status}'")
-    
-    query_parts.append("ORDER BY updated DESC")
-    
-    return " AND ".join(query_parts[:-1]) + " " + query_parts[-1]
+        jql += f" AND status = '{status}'"
+    if since:
+        jql += f' AND updated >= "{since}"'
+    return f"{jql} ORDER BY updated DESC"
 
 
-async def fetch_tickets_via_api(page, jql_query, max_results=100):
+async def fetch_search_page(request, jql_query, start_at=0, max_results=100, next_page_token=None):
     """
-    Fetch tickets using Jira REST API.
+    Fetch a single page of search results from the Jira REST API.
     
-    Uses the browser session (with cookies) to authenticate the API request.
+    Issues the request through a Playwright APIRequestContext (either a
+    browser context's or a standalone one), so session cookies are reused
+    without rendering the response as a page.
     Returns the parsed JSON response or None on failure.
     """
-    # URL-encode the JQL query
-    jql_encoded = jql_query.replace(" ", "%20").replace("=", "%3D").replace("'", "%27").replace("(", "%28").replace(")", "%29")
-    
-    # Build API URL with fields we need
-    api_url = f"{JIRA_BASE_URL}/rest/api/2/search?jql={jql_encoded}&maxResults={max_results}&fields=key,summary,status,priority,assignee,reporter,labels,created,updated,description"
+    # Build API URL with fields we need (urlencode handles JQL escaping);
+    # an empty expand disables the default expansions
+    params = {
+        "jql": jql_query,
+        "startAt": start_at,
+        "maxResults": max_results,
+        "fields": ",".join(NEEDED_FIELDS),
+        "expand": "",
+    }
+    if next_page_token:
+        params["nextPageToken"] = next_page_token
+    api_url = f"{JIRA_BASE_URL}/rest/api/2/search?{urlencode(params, quote_via=quote)}"
     
-    print(f"Query: {jql_query}")
-    print("Fetching tickets from API...")
-    response = await page.goto(api_url)
+    response = await request.get(api_url, headers={"Accept": "application/json"})
     
     if response.status != 200:
         print(f"API request failed with status {response.status}")
         return None
     
-    # Extract JSON from page content
-    # The browser wraps JSON responses in HTML, so we need to extract it
-    content = await page.content()
-    
-    # Try to find JSON in <pre> tags first (Chrome format)
-    json_match = re.search(r'<pre[^>]*>(.*?)</pre>', content, re.DOTALL)
-    if json_match:
-        json_text = json_match.group(1)
-        # Decode HTML entities
-        json_text = json_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"')
-    else:
-        # Fallback: try to extract from body
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', content, re.DOTALL)
-        if body_match:
-            json_text = body_match.group(1).strip()
-            # Strip any remaining HTML tags
-            json_text = re.sub(r'<[^>]+>', '', json_text)
-            json_text = json_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"')
-        else:
-            json_text = content
-    
     # Parse and return JSON
     try:
-        return json.loads(json_text)
+        return json.loads(await response.body())
     except json.JSONDecodeError as e:
         print(f"Failed to parse JSON: {e}")
         return None
 
+
+async def iter_search_pages(request, jql_query, page_size=100):
+    """
+    Fetch all tickets matching a JQL query using Jira REST API.
+    
+    Async generator yielding the list of issues from each page in query
+    order, so callers can start processing while later pages are still
+    downloading. The first page reports the total number of matches; the
+    remaining pages are then requested concurrently (at most
+    MAX_CONCURRENT_REQUESTS at a time). Responses that use cursor
+    pagination instead of a total are followed page by page.
+    Yields None (and stops) if any page fails.
+    """
+    print(f"Query: {jql_query}")
+    print("Fetching tickets from API...")
+    data = await fetch_search_page(request, jql_query, 0, page_size)
+    if data is None:
+        yield None
+        return
+    
+    # The server may cap maxResults below what we asked for
+    page_size = data.get("maxResults") or page_size
+    
+    if "total" not in data:
+        yield data.get("issues", [])
+        
+        # Cursor pagination: each page only tells us where the next one is
+        token = data.get("nextPageToken")
+        while token:
+            result = await fetch_search_page(
+                request, jql_query, max_results=page_size, next_page_token=token
+            )
+            if result is None:
+                yield None
+                return
+            yield result.get("issues", [])
+            token = result.get("nextPageToken")
+        return
+    
+    total = data["total"]
+    offsets = range(page_size, total, page_size)
+    
+    # Start the remaining pages before handing out the first one
+    spawn = bounded_spawner(MAX_CONCURRENT_REQUESTS)
+    tasks = [
+        spawn(fetch_search_page(request, jql_query, offset, page_size))
+        for offset in offsets
+    ]
+    if tasks:
+        print(f"Fetching {len(tasks)} more page(s) of {total} tickets...")
+    
+    yield data.get("issues", [])
+    
+    # Hand pages out in offset order so issues keep the JQL's ORDER BY;
+    # later pages keep downloading while earlier ones are processed
+    for task in tasks:
+        result = await task
+        if result is None:
+            for pending in tasks:
+                pending.cancel()
+            yield None
+            return
+        yield result.get("issues", [])
+
+
 # =============================================================================
 # Ticket processing and output
 # =============================================================================
@@ -514,80 +819,333 @@ def format_ticket(issue):
     
     Handles missing/null fields gracefully with default values.
     """
-    fields = issue.get("fields", {})
+    fields = issue.get("fields") or {}
     key = issue.get("key", "N/A")
     
+    # Nested objects may be missing or explicitly null
+    status = fields.get("status") or {}
+    priority = fields.get("priority") or {}
+    assignee = fields.get("assignee") or {}
+    reporter = fields.get("reporter") or {}
+    
     return {
         "key": key,
-        "summary": fields.get("summary", "N/A"),
-        "status": fields.get("status", {}).get("name", "") if fields.get("status") else "",
-        "priority": fields.get("priority", {}).get("name", "N/A") if fields.get("priority") else "N/A",
-        "assignee": fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
-        "reporter": fields.get("reporter", {}).get("displayName", "N/A") if fields.get("reporter") else "N/A",
-        "labels": ", ".join(fields.get("labels", [])) or "None",
+        "summary": fields.get("summary") or "N/A",
+        "status": status.get("name", ""),
+        "priority": priority.get("name") or "N/A",
+        "assignee": assignee.get("displayName") or "Unassigned",
+        "reporter": reporter.get("displayName") or "N/A",
+        "labels": ", ".join(fields.get("labels") or []) or "None",
         "created": fields.get("created", "N/A"),
         "updated": fields.get("updated", "N/A"),
-        "description": fields.get("description", "No description provided") or "No description provided",
+        "description": fields.get("description") or "No description provided",
         "url": f"{JIRA_BASE_URL}/browse/{key}"
     }
 
 
+@lru_cache(maxsize=64)
 def sanitize_folder_name(name):
     """
     Convert status name to a valid folder name.
     
-    Replaces spaces and special characters with underscores.
+    Replaces spaces and special characters with underscores. Results are
+    cached since tickets share a small set of status names.
     """
     if not name:
         return "Unknown"
     # Replace spaces and special chars with underscores, convert to lowercase
-    sanitized = re.sub(r'[^\w\-]', '_', name.lower())
+    sanitized = _NON_WORD_RE.sub('_', name.lower())
     # Remove consecutive underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _MULTI_UNDERSCORE_RE.sub('_', sanitized)
     return sanitized.strip('_')
 
 
-def save_ticket_description(ticket):
+@lru_cache(maxsize=64)
+def status_dir(status):
+    """Return the output folder for a status, reusing the Path per status."""
+    return OUTPUT_DIR / sanitize_folder_name(status)
+
+
+# Status folders already created during this run
+_CREATED_DIRS = set()
+
+
+def _ensure_dir(path):
+    """Create a directory once per run, skipping the mkdir syscall afterwards."""
+    if path not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+
+def _write_ticket_file(ticket_dir, filepath, chunks):
+    """Create the status folder and write a ticket file (blocking)."""
+    _ensure_dir(ticket_dir)
+    with open(filepath, "wb") as f:
+        f.writelines(chunks)
+
+
+def ticket_path(ticket):
+    """Return the output file for a ticket inside its status folder."""
+    return status_dir(ticket['status']) / f"{ticket['key']}.txt"
+
+
+async def load_manifest():
+    """
+    Load the manifest of previously saved tickets.
+    
+    Maps each ticket key to the "updated" timestamp and relative path it
+    was last saved with.
+    """
+    if MANIFEST_FILE.exists():
+        try:
+            return await asyncio.to_thread(_read_json, MANIFEST_FILE)
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+
+async def save_manifest(manifest):
+    """Write the saved-tickets manifest atomically."""
+    await asyncio.to_thread(_write_json_atomic, MANIFEST_FILE, manifest)
+
+
+def relative_ticket_path(filepath):
+    """Ticket file path relative to OUTPUT_DIR, as stored in the manifest."""
+    return filepath.relative_to(OUTPUT_DIR).as_posix()
+
+
+def _scan_output_dir():
+    """
+    List ticket files already present in the status folders (blocking).
+    
+    One scandir pass replaces a stat per ticket. Existing status folders
+    are also recorded so they are not mkdir'd again.
+    
+    Returns:
+        Set of paths relative to OUTPUT_DIR (e.g. "in_progress/PROJ-1.txt")
+    """
+    existing = set()
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with os.scandir(OUTPUT_DIR) as folders:
+        for folder in folders:
+            if not folder.is_dir():
+                continue
+            _CREATED_DIRS.add(OUTPUT_DIR / folder.name)
+            with os.scandir(folder.path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        existing.add(f"{folder.name}/{entry.name}")
+    return existing
+
+
+def is_unchanged(ticket, filepath, manifest, existing):
+    """True if the ticket was already saved to filepath at its current version."""
+    entry = manifest.get(ticket['key'])
+    if entry is None or entry.get("updated") != ticket['updated']:
+        return False
+    relative_path = relative_ticket_path(filepath)
+    return entry.get("path") == relative_path and relative_path in existing
+
+
+def ticket_text_chunks(ticket):
+    """Render a ticket as the encoded chunks of its plain-text file."""
+    header = "\n".join((
+        f"Ticket: {ticket['key']}",
+        f"Summary: {ticket['summary']}",
+        f"URL: {ticket['url']}",
+        f"Status: {ticket['status']}",
+        f"Priority: {ticket['priority']}",
+        f"Assignee: {ticket['assignee']}",
+        f"Reporter: {ticket['reporter']}",
+        f"Labels: {ticket['labels']}",
+        f"Created: {ticket['created']}",
+        f"Updated: {ticket['updated']}",
+        "",
+        "Description:",
+        "",
+    ))
+    
+    # Write the description as its own chunk so large descriptions are
+    # never copied into one combined header+description string
+    return (header.encode("utf-8"), ticket['description'].encode("utf-8"), b"\n")
+
+
+def ticket_markdown_chunks(ticket):
+    """Render a ticket as the encoded chunks of a section in tickets.md."""
+    header = "\n".join((
+        f"## [{ticket['key']}]({ticket['url']}): {ticket['summary']}",
+        "",
+        f"- Status: {ticket['status']}",
+        f"- Priority: {ticket['priority']}",
+        f"- Assignee: {ticket['assignee']}",
+        f"- Reporter: {ticket['reporter']}",
+        f"- Labels: {ticket['labels']}",
+        f"- Created: {ticket['created']}",
+        f"- Updated: {ticket['updated']}",
+        "",
+        "",
+    ))
+    return (header.encode("utf-8"), ticket['description'].encode("utf-8"), b"\n\n")
+
+
+def ticket_jsonl_chunks(ticket):
+    """Render a ticket as one line of tickets.jsonl."""
+    return (json.dumps(ticket, ensure_ascii=False).encode("utf-8"), b"\n")
+
+
+async def save_ticket_description(ticket, filepath):
     """
     Save ticket details to a text file.
     
     Creates one file per ticket, organized into folders by status.
+    The blocking file I/O runs in a worker thread so multiple tickets
+    can be saved concurrently.
     """
-    # Create status-based subfolder
-    status_folder = sanitize_folder_name(ticket['status'])
-    ticket_dir = OUTPUT_DIR / status_folder
-    ticket_dir.mkdir(parents=True, exist_ok=True)
-    
-    filepath = ticket_dir / f"{ticket['key']}.txt"
-    
-    content = f"""Ticket: {ticket['key']}
-Summary: {ticket['summary']}
-URL: {ticket['url']}
-Status: {ticket['status']}
-Priority: {ticket['priority']}
-Assignee: {ticket['assignee']}
-Reporter: {ticket['reporter']}
-Labels: {ticket['labels']}
-Created: {ticket['created']}
-Updated: {ticket['updated']}
-
-Description:
-{ticket['description']}
-"""
-    
-    with open(filepath, "w") as f:
-        f.write(content)
+    chunks = ticket_text_chunks(ticket)
+    await asyncio.to_thread(_write_ticket_file, filepath.parent, filepath, chunks)
     
-    print(f"Saved: {filepath}")
     return filepath
 
+
+async def save_combined(pages, output_format):
+    """
+    Format all issues into a single output file (jsonl or single-md).
+    
+    The file is written once, after the last page has arrived, so a run
+    costs one open/write/close no matter how many tickets there are. It is
+    written to a temp file and renamed into place, so the previous file is
+    left untouched if fetching a page or writing fails.
+    
+    Returns the list of all issues, or None if fetching a page failed.
+    """
+    render = ticket_jsonl_chunks if output_format == "jsonl" else ticket_markdown_chunks
+    filepath = COMBINED_OUTPUT_FILES[output_format]
+    
+    issues = []
+    async for page_issues in pages:
+        if page_issues is None:
+            return None
+        issues.extend(page_issues)
+    
+    print(f"\nFound {len(issues)} tickets")
+    
+    # Tickets are formatted lazily by the writer thread, so only the raw
+    # issues (also needed for the search cache) are held in memory
+    chunks = (chunk for issue in issues for chunk in render(format_ticket(issue)))
+    try:
+        await asyncio.to_thread(_write_file_atomic, filepath, chunks)
+        print(f"Saved: {filepath}")
+    except OSError as e:
+        print(f"Failed to save {filepath}: {e}")
+    
+    return issues
+
+
+async def save_tickets(pages, output_format="per-file"):
+    """
+    Format and save issues concurrently as pages of them arrive.
+    
+    Takes an async iterable of issue lists (see iter_search_pages); the
+    tickets of each page start saving while later pages are still being
+    fetched. Tickets whose "updated" timestamp and target file match the
+    manifest from a previous run are skipped. At most MAX_CONCURRENT_SAVES
+    files are written at once. A failure to save one ticket is reported
+    without aborting the others.
+    
+    Other output formats are handed to save_combined.
+    
+    Returns the list of all issues, or None if fetching a page failed.
+    """
+    if output_format != "per-file":
+        return await save_combined(pages, output_format)
+    
+    manifest = await load_manifest()
+    existing = await asyncio.to_thread(_scan_output_dir) if manifest else set()
+    spawn = bounded_spawner(MAX_CONCURRENT_SAVES)
+    
+    # Schedule each save as its issue is formatted; no intermediate list
+    # of formatted tickets is kept around
+    issues = []
+    saves = []
+    unchanged = 0
+    fetch_failed = False
+    async for page_issues in pages:
+        if page_issues is None:
+            fetch_failed = True
+            break
+        for issue in page_issues:
+            issues.append(issue)
+            ticket = format_ticket(issue)
+            filepath = ticket_path(ticket)
+            if is_unchanged(ticket, filepath, manifest, existing):
+                unchanged += 1
+                continue
+            task = spawn(save_ticket_description(ticket, filepath))
+            saves.append((ticket['key'], ticket['updated'], task))
+    
+    if not fetch_failed:
+        print(f"\nFound {len(issues)} tickets ({unchanged} unchanged)")
+    results = await asyncio.gather(*(task for _, _, task in saves), return_exceptions=True)
+    
+    saved_paths = []
+    errors = []
+    for (key, updated, _), result in zip(saves, results):
+        if isinstance(result, Exception):
+            errors.append(f"Failed to save {key}: {result}")
+        else:
+            saved_paths.append(f"Saved: {result}")
+            manifest[key] = {"updated": updated, "path": relative_ticket_path(result)}
+    
+    # Report all saved files in a single write instead of one print per ticket
+    if saved_paths or errors:
+        print("\n".join(saved_paths + errors))
+    
+    if saved_paths:
+        await save_manifest(manifest)
+    
+    return None if fetch_failed else issues
+
+
 # =============================================================================
 # Main entry point
 # =============================================================================
 
 
+async def run_fetch(api, jql_query, output_format="per-file"):
+    """
+    Fetch and save tickets over an APIRequestContext.
+    
+    output_format selects how tickets are written (see OUTPUT_FORMATS).
+    
+    On success, persists any refreshed session cookies and caches the
+    search response. Returns True on success, False on failure.
+    """
+    # Fetch tickets from Jira API, saving each page as it arrives
+    issues = await save_tickets(iter_search_pages(api, jql_query), output_format)
+    if issues is None:
+        return False
+    
+    # Keep any cookies the server refreshed
+    await save_session(await api.storage_state())
+    await save_cached_search(jql_query, {"issues": issues})
+    return True
+
+
+async def run_status_change(api, issue_keys, target_status):
+    """Change ticket statuses over an APIRequestContext. Returns True on success."""
+    success = await change_ticket_status(api, issue_keys, target_status)
+    
+    # Cached search results no longer reflect the new statuses
+    await clear_search_cache()
+    return success
+
+
 async def main():
-    """Main entry point - parse args, authenticate, fetch and save tickets."""
+    """
+    Main entry point - parse args, authenticate, fetch and save tickets.
+    
+    Returns the process exit code: 0 on success, 1 on failure.
+    """
     parser = argparse.ArgumentParser(
         description="Scrape Jira tickets assigned to you, or change ticket status",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -597,14 +1155,19 @@ Examples:
   %(prog)s --status "In Progress" Fetch only in-progress tickets
   %(prog)s --status "Open"        Fetch only open tickets
   %(prog)s --login --headed       Force new login with visible browser
+  %(prog)s --since 7d             Fetch only tickets updated in the last 7 days
+  %(prog)s --no-cache             Bypass the short-lived results cache
+  %(prog)s --output-format jsonl  Write all tickets to output/tickets.jsonl
   
   %(prog)s --change-status TICKET-123 --to-status "In Progress"
                                   Change ticket status
+  %(prog)s -c TICKET-123 TICKET-456 -t "Done"
+                                  Change status of several tickets
 
 Common status values:
-  {', '.join(VALID_STATUSES)}
+  {EPILOG_STATUSES}
 
-Note: Status values are case-sensitive and may vary by project.
+Note: Status values are matched case-insensitively and may vary by project.
 """
     )
     parser.add_argument(
@@ -614,11 +1177,31 @@ Note: Status values are case-sensitive and may vary by project.
         metavar="STATUS",
         help="Filter by ticket status (e.g., 'In Progress', 'Open')"
     )
+    parser.add_argument(
+        "--since",
+        type=str,
+        default=None,
+        metavar="PERIOD",
+        help="Only fetch tickets updated within a period or since a date "
+             "(e.g., '24h', '7d', '2024-01-31'); 'all' fetches every ticket (default)"
+    )
     parser.add_argument(
         "--login", "-l",
         action="store_true",
         help="Force new login (ignore saved session)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore cached results from the last {CACHE_TTL_SECONDS}s and query Jira"
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="per-file",
+        help="Write one .txt file per ticket in status folders (default), "
+             "or all tickets to output/tickets.jsonl or output/tickets.md"
+    )
     parser.add_argument(
         "--headed",
         action="store_true",
@@ -627,9 +1210,10 @@ Note: Status values are case-sensitive and may vary by project.
     parser.add_argument(
         "--change-status", "-c",
         type=str,
+        nargs="+",
         default=None,
         metavar="TICKET_KEY",
-        help="Change status of a ticket (requires --to-status)"
+        help="Change status of one or more tickets (requires --to-status)"
     )
     parser.add_argument(
         "--to-status", "-t",
@@ -646,60 +1230,90 @@ Note: Status values are case-sensitive and may vary by project.
     if args.to_status and not args.change_status:
         parser.error("--to-status requires --change-status")
     
+    # Use the usual spelling of common statuses and point out likely typos
+    # before spending time on a browser or API call; values that are only
+    # similar to a common status may be real project statuses
+    for option in ("status", "to_status"):
+        value = getattr(args, option)
+        if value is None:
+            continue
+        status, suggestion = check_status(value)
+        setattr(args, option, status)
+        if suggestion:
+            print(f"Note: --{option.replace('_', '-')} {value!r} is not a common status (did you mean {suggestion!r}?); using it as given")
+    
+    # Normalize --since to what JQL expects ("7d" -> "-7d")
+    since = None
+    if args.since and args.since != "all":
+        period = _SINCE_PERIOD_RE.fullmatch(args.since)
+        if period:
+            since = f"-{period.group(1)}"
+        elif _SINCE_DATE_RE.fullmatch(args.since):
+            since = args.since
+        else:
+            parser.error(f"Invalid --since {args.since!r}. Use a period like '24h' or '7d', a date like '2024-01-31', or 'all'")
+    
     # Build JQL query based on arguments (only used for fetching)
-    jql_query = build_jql_query(status=args.status)
+    jql_query = build_jql_query(status=args.status, since=since)
+    
+    # Serve a repeat query from the recent results cache without starting
+    # Playwright at all
+    if not (args.change_status or args.no_cache or args.login):
+        data = await load_cached_search(jql_query)
+        if data is not None:
+            print(f"Query: {jql_query}")
+            print(f"Using results cached within the last {CACHE_TTL_SECONDS}s")
+            await save_tickets(iter_cached_pages(data), args.output_format)
+            return 0
+    
+    # Saved session state (skip if --login flag)
+    session = None if args.login else await load_session()
     
     async with async_playwright() as p:
-        # Launch browser (headed mode if --headed flag is set)
-        browser = await p.chromium.launch(headless=not args.headed)
-        context = await browser.new_context()
-        
-        # Restore session cookies if available (skip if --login flag)
-        if not args.login:
-            cookies = await load_cookies()
-            if cookies:
-                await context.add_cookies(cookies)
+        # Fast path: with a saved session, do all the work over plain HTTP
+        # and only launch a browser if the session is no longer valid
+        if session:
+            api = await new_api_context(p, session)
+            
+            # Only an expired session warrants a browser; other API errors
+            # (a bad JQL value, a server error) would just fail again
+            if await has_valid_session(api):
+                if args.change_status:
+                    success = await run_status_change(api, args.change_status, args.to_status)
+                    await api.dispose()
+                    return 0 if success else 1
+                
+                success = await run_fetch(api, jql_query, args.output_format)
+                if not success:
+                    print("Failed to fetch tickets")
+                await api.dispose()
+                return 0 if success else 1
+            
+            await api.dispose()
+            print("Saved session is no longer valid. Launching browser...")
         
-        page = await context.new_page()
-        await page.goto(JIRA_BASE_URL)
-        await page.wait_for_timeout(2000)
+        # Establish the session through a real browser, which is closed again
+        # as soon as its state has been exported; the rest runs over HTTP
+        session = await establish_session(p, headed=args.headed, force_login=args.login)
+        if session is None:
+            print("Login failed")
+            return 1
         
-        # Check if we need to login (redirected to login page)
-        if "login" in page.url.lower() or "microsoftonline" in page.url:
-            print("Session expired or no session found. Logging in...")
-            await login(page, headed=args.headed)
-            await page.wait_for_timeout(3000)
+        api = await new_api_context(p, session)
         
         # Handle status change mode
         if args.change_status:
-            success = await change_ticket_status(page, args.change_status, args.to_status)
-            
-            # Save cookies for future sessions
-            cookies = await context.cookies()
-            await save_cookies(cookies)
-            
-            await browser.close()
+            success = await run_status_change(api, args.change_status, args.to_status)
+            await api.dispose()
             return 0 if success else 1
         
-        # Fetch tickets from Jira API
-        data = await fetch_tickets_via_api(page, jql_query)
-        
-        if data and "issues" in data:
-            # Save cookies for future sessions
-            cookies = await context.cookies()
-            await save_cookies(cookies)
-            
-            # Process and save each ticket
-            tickets = [format_ticket(issue) for issue in data["issues"]]
-            print(f"\nFound {len(tickets)} tickets")
-            
-            for ticket in tickets:
-                save_ticket_description(ticket)
-        else:
+        success = await run_fetch(api, jql_query, args.output_format)
+        if not success:
             print("Failed to fetch tickets")
         
-        await browser.close()
+        await api.dispose()
+        return 0 if success else 1
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(asyncio.run(main()))
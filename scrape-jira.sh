@@ -11,12 +11,16 @@
 # Usage:
 #   ./scrape-jira.sh                          # Fetch all tickets
 #   ./scrape-jira.sh --status "In Progress"   # Fetch only in-progress tickets
+#   ./scrape-jira.sh --since 7d               # Only recently updated tickets
 #   ./scrape-jira.sh --login                  # Force new login
+#   ./scrape-jira.sh --no-cache               # Ignore cached results
+#   ./scrape-jira.sh --output-format jsonl    # All tickets in one JSONL file
 #   ./scrape-jira.sh --help                   # Show help
 #
 # Change ticket status:
 #   ./scrape-jira.sh --change-status TICKET-123 --to-status "In Progress"
 #   ./scrape-jira.sh -c TICKET-123 -t "Done"
+#   ./scrape-jira.sh -c TICKET-123 TICKET-456 -t "Done"
 #
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"